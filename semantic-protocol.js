@@ -6,10 +6,413 @@
  * No dependencies. Just pure functions that understand meaning.
  */
 
+// ============================================================================
+// SEMANTIC IDENTIFICATION RULES
+// ============================================================================
+
+// Exact-match vocabularies for the rules, built once instead of per call
+const CURRENCY_TYPES = new Set(['decimal', 'money', 'currency']);
+const FLOAT_TYPES = new Set(['float', 'double', 'number']);
+const TEMPORAL_TYPES = new Set(['timestamp', 'datetime', 'date', 'time']);
+const PREMIUM_TIERS = new Set(['premium', 'pro', 'gold']);
+const IDENTIFIER_NAMES = new Set(['id', 'uid', 'uuid', 'guid']);
+const STATUS_NAMES = new Set(['active', 'enabled', 'visible', 'published']);
+const CATEGORY_NAMES = new Set(['type', 'kind', 'category']);
+
+// Keyword groups, one bit each, so a name's hits fit in a single mask
+const CANCELLATION_WORDS = 1 << 0;
+const INACTIVE_WORDS = 1 << 1;
+const CURRENCY_WORDS = 1 << 2;
+const CURRENCY_CODES = 1 << 3;
+const TEMPORAL_WORDS = 1 << 4;
+const PREMIUM_WORDS = 1 << 5;
+const DANGER_WORDS = 1 << 6;
+const RESTRICTED_WORDS = 1 << 7;
+const FLAG_PREFIX = 1 << 11;
+const TIER_WORDS = 1 << 12;
+const IDENTIFIER_WORDS = 1 << 13;
+const STATUS_WORDS = 1 << 14;
+const PERCENTAGE_WORDS = 1 << 15;
+const RATIO_WORDS = 1 << 16;
+const EMAIL_WORDS = 1 << 17;
+const URL_WORDS = 1 << 18;
+
+// Suffix groups only count when the name ends with them
+const TEMPORAL_SUFFIXES = 1 << 8;
+const IDENTIFIER_SUFFIXES = 1 << 9;
+const PERCENTAGE_SUFFIXES = 1 << 10;
+const SUFFIX_GROUPS = TEMPORAL_SUFFIXES | IDENTIFIER_SUFFIXES | PERCENTAGE_SUFFIXES;
+
+const KEYWORD_GROUPS = [
+  [CANCELLATION_WORDS, ['cancel', 'terminate', 'expire', 'revoke', 'void', 'delete']],
+  [INACTIVE_WORDS, ['inactive', 'disabled']],
+  [CURRENCY_WORDS, ['price', 'amount', 'balance', 'cost', 'fee', 'payment', 'salary', 'revenue']],
+  [CURRENCY_CODES, ['usd', 'eur', 'gbp']],
+  [TEMPORAL_WORDS, ['created', 'updated', 'modified', 'deleted', 'last_', 'next_']],
+  [PREMIUM_WORDS, ['premium', 'pro', 'vip', 'gold', 'platinum', 'elite', 'plus']],
+  [DANGER_WORDS, ['error', 'fail', 'critical', 'severe', 'fatal', 'emergency', 'breach']],
+  [RESTRICTED_WORDS, ['blocked', 'banned', 'suspended']],
+  [FLAG_PREFIX, ['is_']],
+  [TIER_WORDS, ['tier']],
+  [IDENTIFIER_WORDS, ['identifier', 'reference']],
+  [STATUS_WORDS, ['status', 'state']],
+  [PERCENTAGE_WORDS, ['percent', 'pct']],
+  [RATIO_WORDS, ['ratio', 'factor']],
+  [EMAIL_WORDS, ['email', 'mail']],
+  [URL_WORDS, ['url', 'link', 'website']],
+  [TEMPORAL_SUFFIXES, ['_at', '_on']],
+  [IDENTIFIER_SUFFIXES, ['_id', '_key']],
+  [PERCENTAGE_SUFFIXES, ['_rate']],
+];
+
+// Every keyword is ASCII, so any other character just restarts the match
+const KEYWORD_ALPHABET = 128;
+
+/**
+ * Aho-Corasick over every keyword group at once, flattened into a dense
+ * transition table so a scan is one array lookup per character.
+ */
+function buildKeywordAutomaton(groups) {
+  const trie = [new Map()];
+  const outputs = [0];
+  
+  for (const [bit, words] of groups) {
+    for (const word of words) {
+      let state = 0;
+      for (const char of word) {
+        let next = trie[state].get(char.charCodeAt(0));
+        if (next === undefined) {
+          next = trie.length;
+          trie.push(new Map());
+          outputs.push(0);
+          trie[state].set(char.charCodeAt(0), next);
+        }
+        state = next;
+      }
+      outputs[state] |= bit;
+    }
+  }
+  
+  // Breadth-first, so a state's failure link is complete before its children
+  const delta = new Uint16Array(trie.length * KEYWORD_ALPHABET);
+  const failure = new Array(trie.length).fill(0);
+  const queue = [0];
+  for (let i = 0; i < queue.length; i++) {
+    const state = queue[i];
+    for (let code = 0; code < KEYWORD_ALPHABET; code++) {
+      const next = trie[state].get(code);
+      if (next === undefined) {
+        delta[state * KEYWORD_ALPHABET + code] = delta[failure[state] * KEYWORD_ALPHABET + code];
+        continue;
+      }
+      delta[state * KEYWORD_ALPHABET + code] = next;
+      if (state !== 0) {
+        failure[next] = delta[failure[state] * KEYWORD_ALPHABET + code];
+      }
+      outputs[next] |= outputs[failure[next]];
+      queue.push(next);
+    }
+  }
+  
+  return { delta, outputs: Uint32Array.from(outputs) };
+}
+
+const KEYWORDS = buildKeywordAutomaton(KEYWORD_GROUPS);
+
+// The rules for one field run back to back on the same name, so
+// remembering the last scan means each name is scanned once. Suffix
+// groups are read from the final state: the patterns ending there.
+let lastScannedName = '';
+let lastKeywordMask = 0;
+
+function keywordsIn(name) {
+  if (name === lastScannedName) {
+    return lastKeywordMask;
+  }
+  let state = 0;
+  let mask = 0;
+  for (let i = 0; i < name.length; i++) {
+    const code = name.charCodeAt(i);
+    state = code < KEYWORD_ALPHABET ? KEYWORDS.delta[state * KEYWORD_ALPHABET + code] : 0;
+    mask |= KEYWORDS.outputs[state];
+  }
+  mask = (mask & ~SUFFIX_GROUPS) | (KEYWORDS.outputs[state] & SUFFIX_GROUPS);
+  lastScannedName = name;
+  lastKeywordMask = mask;
+  return mask;
+}
+
+// The email shape is two plain includes() rather than a regex: for values
+// that don't match, an email pattern has to backtrack through the whole
+// string, and V8 runs it an order of magnitude slower than includes().
+// Folding the '@' and '.' tests into one charCodeAt() loop doesn't pay
+// either; the two native scans beat it several times over, and the '.'
+// scan only runs once an '@' has been found.
+//
+// The URL shape is checked as in the TypeScript analyzer: a first-character
+// guard rejects most values with one compare, and the rest go through one
+// anchored, precompiled regex. In V8 that regex is clearly faster than the
+// startsWith() pair the TS scheme check would need, and within a few
+// nanoseconds of the single startsWith() this check would need, so both
+// ports use it.
+const URL_PREFIX_PATTERN = /^(?:http|www)/;
+const CHAR_H = 0x68;
+const CHAR_W = 0x77;
+
+function looksLikeEmail(value) {
+  return typeof value === 'string' && value.includes('@') && value.includes('.');
+}
+
+function looksLikeUrl(value) {
+  if (typeof value !== 'string') {
+    return false;
+  }
+  // Most values start with neither letter, which settles it in one compare
+  const first = value.charCodeAt(0);
+  return (first === CHAR_H || first === CHAR_W) && URL_PREFIX_PATTERN.test(value);
+}
+
+function isUnitInterval(value) {
+  return typeof value === 'number' && value >= 0 && value <= 1;
+}
+
+// Everything the built-in rules can tell about a value, one bit per check
+const VALUE_EMAIL = 1 << 0;
+const VALUE_URL = 1 << 1;
+const VALUE_UNIT_INTERVAL = 1 << 2;
+const VALUE_PREMIUM_TIER = 1 << 3;
+
+function valueShape(value) {
+  return (looksLikeEmail(value) ? VALUE_EMAIL : 0) |
+    (looksLikeUrl(value) ? VALUE_URL : 0) |
+    (isUnitInterval(value) ? VALUE_UNIT_INTERVAL : 0) |
+    (PREMIUM_TIERS.has(value) ? VALUE_PREMIUM_TIER : 0);
+}
+
+// Plain functions, so the rule table calls them without a method lookup.
+// Each takes the field name already lowercased, plus its type and value.
+function isCancellation(name, type, value) {
+  const keywords = keywordsIn(name);
+  
+  if (keywords & CANCELLATION_WORDS) {
+    return 0.95;
+  }
+  if (type === 'boolean' && (keywords & FLAG_PREFIX) && (keywords & INACTIVE_WORDS)) {
+    return 0.85;
+  }
+  return 0.0;
+}
+
+function isCurrency(name, type, value) {
+  const keywords = keywordsIn(name);
+  const lowerType = (type || '').toLowerCase();
+  
+  if (CURRENCY_TYPES.has(lowerType)) {
+    return 0.95;
+  }
+  if (keywords & CURRENCY_WORDS) {
+    return 0.90;
+  }
+  if (FLOAT_TYPES.has(lowerType) && (keywords & CURRENCY_CODES)) {
+    return 0.85;
+  }
+  return 0.0;
+}
+
+function isTemporal(name, type, value) {
+  const keywords = keywordsIn(name);
+  const lowerType = (type || '').toLowerCase();
+  
+  if (TEMPORAL_TYPES.has(lowerType)) {
+    return 0.95;
+  }
+  if (keywords & TEMPORAL_SUFFIXES) {
+    return 0.90;
+  }
+  if (keywords & TEMPORAL_WORDS) {
+    return 0.85;
+  }
+  return 0.0;
+}
+
+function isPremium(name, type, value) {
+  const keywords = keywordsIn(name);
+  
+  if (keywords & PREMIUM_WORDS) {
+    return 0.90;
+  }
+  if ((keywords & TIER_WORDS) && PREMIUM_TIERS.has(value)) {
+    return 0.85;
+  }
+  return 0.0;
+}
+
+function isIdentifier(name, type, value) {
+  const keywords = keywordsIn(name);
+  
+  if (IDENTIFIER_NAMES.has(name)) {
+    return 0.95;
+  }
+  if (keywords & IDENTIFIER_SUFFIXES) {
+    return 0.90;
+  }
+  if (keywords & IDENTIFIER_WORDS) {
+    return 0.85;
+  }
+  return 0.0;
+}
+
+function isStatus(name, type, value) {
+  const keywords = keywordsIn(name);
+  
+  if (keywords & STATUS_WORDS) {
+    return 0.95;
+  }
+  if (STATUS_NAMES.has(name)) {
+    return 0.85;
+  }
+  if (type === 'enum' && CATEGORY_NAMES.has(name)) {
+    return 0.80;
+  }
+  return 0.0;
+}
+
+function isPercentage(name, type, value) {
+  const keywords = keywordsIn(name);
+  
+  if (keywords & (PERCENTAGE_WORDS | PERCENTAGE_SUFFIXES)) {
+    return 0.95;
+  }
+  if (keywords & RATIO_WORDS) {
+    return 0.85;
+  }
+  if (isUnitInterval(value)) {
+    return 0.70;
+  }
+  return 0.0;
+}
+
+function isEmail(name, type, value) {
+  const keywords = keywordsIn(name);
+  
+  if (keywords & EMAIL_WORDS) {
+    return 0.95;
+  }
+  if (looksLikeEmail(value)) {
+    return 0.90;
+  }
+  return 0.0;
+}
+
+function isUrl(name, type, value) {
+  const keywords = keywordsIn(name);
+  
+  if (keywords & URL_WORDS) {
+    return 0.95;
+  }
+  if (looksLikeUrl(value)) {
+    return 0.90;
+  }
+  return 0.0;
+}
+
+function isDanger(name, type, value) {
+  const keywords = keywordsIn(name);
+  
+  if (keywords & DANGER_WORDS) {
+    return 0.90;
+  }
+  if (type === 'boolean' && (keywords & FLAG_PREFIX) && (keywords & RESTRICTED_WORDS)) {
+    return 0.85;
+  }
+  return 0.0;
+}
+
+// Highest confidence each built-in rule can return, so a search for the
+// best match can stop once no remaining rule could beat the leader
+const RULE_CEILINGS = new Map([
+  [isCancellation, 0.95],
+  [isCurrency, 0.95],
+  [isTemporal, 0.95],
+  [isPremium, 0.90],
+  [isIdentifier, 0.95],
+  [isStatus, 0.95],
+  [isPercentage, 0.95],
+  [isEmail, 0.95],
+  [isUrl, 0.95],
+  [isDanger, 0.90],
+]);
+
+// semanticRules exposes the built-in rules with the same field-object
+// contract as any rule a caller adds; compile() swaps each one back for
+// its positional function
+const POSITIONAL_RULES = new Map();
+
+function fieldRule(rule) {
+  const byField = field => rule((field.name || '').toLowerCase(), field.type, field.value);
+  POSITIONAL_RULES.set(byField, rule);
+  return byField;
+}
+
+const BUILT_IN_RULES = {
+  'cancellation': fieldRule(isCancellation),
+  'currency': fieldRule(isCurrency),
+  'temporal': fieldRule(isTemporal),
+  'premium': fieldRule(isPremium),
+  'identifier': fieldRule(isIdentifier),
+  'status': fieldRule(isStatus),
+  'percentage': fieldRule(isPercentage),
+  'email': fieldRule(isEmail),
+  'url': fieldRule(isUrl),
+  'danger': fieldRule(isDanger),
+};
+
 // ============================================================================
 // CORE PROTOCOL
 // ============================================================================
 
+function fieldSpec(field) {
+  /**
+   * Normalize a batch entry, either a field object or a bare name
+   */
+  if (typeof field === 'object' && field !== null) {
+    return {
+      name: field.name || 'unknown',
+      type: field.type || 'string',
+      value: field.value
+    };
+  }
+  return { name: String(field), type: 'string', value: null };
+}
+
+// Analysis results for repeated fields are memoized; the cache is emptied
+// when it fills up. Kept small enough that results of one-off fields die
+// young instead of being promoted by the garbage collector.
+const CACHE_SIZE = 1024;
+
+function cacheKey(fieldName, fieldType, fieldValue, context, includeMatches, exactValues) {
+  /**
+   * Key a field by its inputs, or null if it can't be keyed.
+   * 
+   * The built-in rules only see a value's shape, so rows of one field
+   * share an entry; a custom rule might look at anything, so then the
+   * value itself goes in the key and must be a primitive.
+   */
+  if (typeof fieldName !== 'string' || typeof fieldType !== 'string' || typeof context !== 'string') {
+    return null;
+  }
+  const prefix = `${fieldName}\u0000${fieldType}\u0000${context}\u0000${includeMatches ? 1 : 0}`;
+  if (!exactValues) {
+    return `${prefix}#${valueShape(fieldValue)}`;
+  }
+  const kind = typeof fieldValue;
+  if (fieldValue !== null && kind !== 'string' && kind !== 'number' &&
+      kind !== 'boolean' && kind !== 'undefined') {
+    return null;
+  }
+  return `${prefix}${kind}:${fieldValue}`;
+}
+
 /**
  * The universal response format
  */
@@ -35,18 +438,7 @@ class SemanticResult {
 class SemanticProtocol {
   constructor() {
     // Semantic identification rules - these recognize meaning
-    this.semanticRules = {
-      'cancellation': (field) => this._isCancellation(field),
-      'currency': (field) => this._isCurrency(field),
-      'temporal': (field) => this._isTemporal(field),
-      'premium': (field) => this._isPremium(field),
-      'identifier': (field) => this._isIdentifier(field),
-      'status': (field) => this._isStatus(field),
-      'percentage': (field) => this._isPercentage(field),
-      'email': (field) => this._isEmail(field),
-      'url': (field) => this._isUrl(field),
-      'danger': (field) => this._isDanger(field),
-    };
+    this.semanticRules = { ...BUILT_IN_RULES };
 
     // Render mapping - semantic + context = instruction
     this.renderMap = {
@@ -103,216 +495,255 @@ class SemanticProtocol {
       'danger:detail': 'alert:danger',
       'danger:form': 'warning:inline',
     };
-  }
 
-  // ========================================================================
-  // SEMANTIC IDENTIFICATION RULES
-  // ========================================================================
-
-  _isCancellation(field) {
-    const name = (field.name || '').toLowerCase();
-    const keywords = ['cancel', 'terminate', 'expire', 'revoke', 'void', 'delete'];
-    
-    if (keywords.some(kw => name.includes(kw))) {
-      return 0.95;
-    }
-    if (field.type === 'boolean' && name.includes('is_') && 
-        ['inactive', 'disabled'].some(kw => name.includes(kw))) {
-      return 0.85;
-    }
-    return 0.0;
+    this._cache = new Map();
+    this._version = 0;
+    this.compile();
   }
 
-  _isCurrency(field) {
-    const name = (field.name || '').toLowerCase();
-    const type = (field.type || '').toLowerCase();
-    
-    const currencyWords = ['price', 'amount', 'balance', 'cost', 'fee', 'payment', 'salary', 'revenue'];
-    
-    if (['decimal', 'money', 'currency'].includes(type)) {
-      return 0.95;
-    }
-    if (currencyWords.some(word => name.includes(word))) {
-      return 0.90;
-    }
-    if (['float', 'double', 'number'].includes(type) && 
-        ['usd', 'eur', 'gbp'].some(word => name.includes(word))) {
-      return 0.85;
-    }
-    return 0.0;
+  _watch(table) {
+    /**
+     * Wrap a table, in place rather than as a copy, so that adding,
+     * replacing or deleting an entry through the wrapper marks the
+     * compiled form stale
+     */
+    return new Proxy(table, {
+      defineProperty: (target, key, descriptor) => {
+        this._stale = true;
+        return Reflect.defineProperty(target, key, descriptor);
+      },
+      deleteProperty: (target, key) => {
+        this._stale = true;
+        return Reflect.deleteProperty(target, key);
+      },
+    });
   }
 
-  _isTemporal(field) {
-    const name = (field.name || '').toLowerCase();
-    const type = (field.type || '').toLowerCase();
-    
-    if (['timestamp', 'datetime', 'date', 'time'].includes(type)) {
-      return 0.95;
-    }
-    if (name.endsWith('_at') || name.endsWith('_on')) {
-      return 0.90;
-    }
-    if (['created', 'updated', 'modified', 'deleted', 'last_', 'next_'].some(word => name.includes(word))) {
-      return 0.85;
-    }
-    return 0.0;
-  }
+  // ========================================================================
+  // CORE PROTOCOL METHODS
+  // ========================================================================
 
-  _isPremium(field) {
-    const name = (field.name || '').toLowerCase();
-    
-    const premiumWords = ['premium', 'pro', 'vip', 'gold', 'platinum', 'elite', 'plus'];
-    
-    if (premiumWords.some(word => name.includes(word))) {
-      return 0.90;
-    }
-    if (name.includes('tier') && ['premium', 'pro', 'gold'].includes(field.value)) {
-      return 0.85;
-    }
-    return 0.0;
+  registerRule(semanticType, ruleFunc) {
+    /**
+     * Add or replace the rule for a semantic type. The rule takes a field
+     * object { name, type, value } and returns a confidence in [0, 1].
+     */
+    this.semanticRules[semanticType] = ruleFunc;
+    return this.compile();
   }
 
-  _isIdentifier(field) {
-    const name = (field.name || '').toLowerCase();
-    
-    if (['id', 'uid', 'uuid', 'guid'].includes(name)) {
-      return 0.95;
-    }
-    if (name.endsWith('_id') || name.endsWith('_key')) {
-      return 0.90;
-    }
-    if (name.includes('identifier') || name.includes('reference')) {
-      return 0.85;
-    }
-    return 0.0;
+  registerRender(semanticType, context, instruction) {
+    /**
+     * Add or replace how a semantic type renders in a context
+     */
+    this.renderMap[`${semanticType}:${context}`] = instruction;
+    return this.compile();
   }
 
-  _isStatus(field) {
-    const name = (field.name || '').toLowerCase();
-    
-    if (name.includes('status') || name.includes('state')) {
-      return 0.95;
-    }
-    if (['active', 'enabled', 'visible', 'published'].includes(name)) {
-      return 0.85;
-    }
-    if (field.type === 'enum' && ['type', 'kind', 'category'].includes(name)) {
-      return 0.80;
+  _refresh() {
+    /**
+     * Recompile if semanticRules or renderMap has been changed through the
+     * protocol, or replaced (by assignment or a subclass field), since the
+     * last compile()
+     */
+    if (this._stale || this.semanticRules !== this._watchedRules || this.renderMap !== this._watchedRenderMap) {
+      this.compile();
     }
-    return 0.0;
   }
 
-  _isPercentage(field) {
-    const name = (field.name || '').toLowerCase();
-    const value = field.value;
-    
-    if (name.includes('percent') || name.includes('pct') || name.endsWith('_rate')) {
-      return 0.95;
-    }
-    if (name.includes('ratio') || name.includes('factor')) {
-      return 0.85;
+  compile() {
+    /**
+     * Flatten semanticRules into the arrays the rule loops walk, and
+     * renderMap into a table indexed by rule.
+     * 
+     * Runs on construction and again on the first call after semanticRules
+     * or renderMap is changed or replaced. Changes made to a table through
+     * some other reference to it are only seen after calling compile().
+     */
+    if (this.semanticRules !== this._watchedRules) {
+      this._watchedRules = this.semanticRules = this._watch(this.semanticRules);
     }
-    if (typeof value === 'number' && value >= 0 && value <= 1) {
-      return 0.70;
+    if (this.renderMap !== this._watchedRenderMap) {
+      this._watchedRenderMap = this.renderMap = this._watch(this.renderMap);
     }
-    return 0.0;
-  }
-
-  _isEmail(field) {
-    const name = (field.name || '').toLowerCase();
-    const value = field.value || '';
+    this._ruleTypes = Object.keys(this.semanticRules);
+    const rules = this._ruleTypes.map(semanticType => this.semanticRules[semanticType]);
     
-    if (name.includes('email') || name.includes('mail')) {
-      return 0.95;
-    }
-    if (typeof value === 'string' && value.includes('@') && value.includes('.')) {
-      return 0.90;
-    }
-    return 0.0;
-  }
-
-  _isUrl(field) {
-    const name = (field.name || '').toLowerCase();
-    const value = field.value || '';
+    // Built-in rules run in their positional form, called as (name, type,
+    // value) with the name lowercased once per field. Any other rule,
+    // including one that wraps a built-in, gets a field object.
+    const positional = rules.map(ruleFunc => POSITIONAL_RULES.get(ruleFunc));
+    this._ruleFuncs = rules.map((ruleFunc, i) => positional[i] ||
+      ((name, type, value, fieldName) => ruleFunc({ name: fieldName, type, value })));
     
-    if (name.includes('url') || name.includes('link') || name.includes('website')) {
-      return 0.95;
-    }
-    if (typeof value === 'string' && (value.startsWith('http') || value.startsWith('www'))) {
-      return 0.90;
-    }
-    return 0.0;
-  }
-
-  _isDanger(field) {
-    const name = (field.name || '').toLowerCase();
+    // Rules we know nothing about could return anything, so they go first,
+    // and might read any part of a value, so results are cached per value
+    this._ceilings = positional.map(rule => (rule ? RULE_CEILINGS.get(rule) : Infinity));
+    this._exactValues = positional.some(rule => !rule);
+    this._searchOrder = this._ruleFuncs
+      .map((_, i) => i)
+      .sort((a, b) => this._ceilings[b] - this._ceilings[a] || a - b);
     
-    const dangerWords = ['error', 'fail', 'critical', 'severe', 'fatal', 'emergency', 'breach'];
+    // Row i holds rule i's instructions by context; the last row is 'default'.
+    // Results point at these strings and the rule names rather than copies,
+    // and V8 already interns literals and property keys, so every result
+    // shares one string per semantic and instruction.
+    this._renderTable = [...this._ruleTypes, 'default'].map(semanticType => {
+      const prefix = `${semanticType}:`;
+      const row = new Map();
+      for (const [key, instruction] of Object.entries(this.renderMap)) {
+        if (key.startsWith(prefix)) {
+          row.set(key.slice(prefix.length), instruction);
+        }
+      }
+      return row;
+    });
     
-    if (dangerWords.some(word => name.includes(word))) {
-      return 0.90;
-    }
-    if (field.type === 'boolean' && name.includes('is_') && 
-        ['blocked', 'banned', 'suspended'].some(word => name.includes(word))) {
-      return 0.85;
+    // The getters hand out copies, so these can be shared
+    const contexts = new Set();
+    for (const key of Object.keys(this.renderMap)) {
+      contexts.add(key.split(':')[1]);
     }
-    return 0.0;
+    this._contexts = Array.from(contexts).sort();
+    this._stale = false;
+    this._version++;
+    this.clearCache();
+    return this;
   }
 
-  // ========================================================================
-  // CORE PROTOCOL METHODS
-  // ========================================================================
+  clearCache() {
+    /**
+     * Forget memoized results
+     */
+    this._cache.clear();
+  }
 
-  analyze(fieldName, fieldType = 'string', fieldValue = null, context = 'list') {
+  analyze(fieldName, fieldType = 'string', fieldValue = null, context = 'list', includeMatches = true) {
     /**
      * The main protocol method: analyze a field and return semantic understanding.
      * 
      * This single method replaces thousands of manual UI decisions.
+     * Results for repeated fields are shared. Pass includeMatches = false
+     * to skip metadata.allMatches, which lets the search stop early.
      */
-    const field = {
-      name: fieldName,
-      type: fieldType,
-      value: fieldValue
-    };
-    
-    // Find the best semantic match
-    let bestSemantic = 'default';
-    let bestConfidence = 0.0;
-    
-    for (const [semanticType, ruleFunc] of Object.entries(this.semanticRules)) {
-      const confidence = ruleFunc(field);
-      if (confidence > bestConfidence) {
-        bestConfidence = confidence;
-        bestSemantic = semanticType;
-      }
+    this._refresh();
+    const key = cacheKey(fieldName, fieldType, fieldValue, context, includeMatches, this._exactValues);
+    const cached = key === null ? undefined : this._cache.get(key);
+    if (cached) {
+      return cached;
     }
     
-    // Get render instruction
-    const renderKey = `${bestSemantic}:${context}`;
-    const renderInstruction = this.renderMap[renderKey] || 'text:plain';
+    const name = (fieldName || '').toLowerCase();
     
-    // Build metadata
+    // Build metadata, including all semantic matches for transparency
     const metadata = {
       field: fieldName,
       type: fieldType,
-      context: context,
-      allMatches: {}
+      context: context
     };
+    let best, bestConfidence;
     
-    // Include all semantic matches for transparency
-    for (const [semanticType, ruleFunc] of Object.entries(this.semanticRules)) {
-      const conf = ruleFunc(field);
-      if (conf > 0) {
-        metadata.allMatches[semanticType] = conf;
+    if (includeMatches) {
+      // Run every rule once, keeping all matches and the best one
+      const allMatches = {};
+      best = this._ruleFuncs.length;
+      bestConfidence = 0.0;
+      
+      for (let i = 0; i < this._ruleFuncs.length; i++) {
+        const conf = this._ruleFuncs[i](name, fieldType, fieldValue, fieldName);
+        if (conf > 0) {
+          allMatches[this._ruleTypes[i]] = conf;
+          if (conf > bestConfidence) {
+            bestConfidence = conf;
+            best = i;
+          }
+        }
       }
+      metadata.allMatches = Object.freeze(allMatches);
+    } else {
+      ({ best, confidence: bestConfidence } = this._bestMatch(fieldName, fieldType, fieldValue));
     }
+    const bestSemantic = this._semanticAt(best);
     
-    return new SemanticResult(
+    // Get render instruction
+    const renderInstruction = this._renderInstruction(best, context);
+    Object.freeze(metadata);
+    
+    // Frozen, so a cached result can be handed out to every caller
+    const result = Object.freeze(new SemanticResult(
       bestSemantic,
       renderInstruction,
       bestConfidence > 0 ? bestConfidence : 1.0,
       metadata
-    );
+    ));
+    
+    if (key !== null) {
+      if (this._cache.size >= CACHE_SIZE) {
+        this._cache.clear();
+      }
+      this._cache.set(key, result);
+    }
+    return result;
+  }
+
+  identify(fieldName, fieldType = 'string', fieldValue = null) {
+    /**
+     * Just the winning semantic type, without building a result
+     */
+    this._refresh();
+    return this._semanticAt(this._bestMatch(fieldName, fieldType, fieldValue).best);
+  }
+
+  render(fieldName, fieldType = 'string', context = 'list', fieldValue = null) {
+    /**
+     * Just the render instruction, without building a result. Arguments
+     * follow the module-level render(); the value, if any, comes last.
+     */
+    this._refresh();
+    const { best } = this._bestMatch(fieldName, fieldType, fieldValue);
+    return this._renderInstruction(best, context);
+  }
+
+  _bestMatch(fieldName, fieldType, fieldValue) {
+    /**
+     * Return the index of the first highest-confidence rule (the rule
+     * count if none matched) and its confidence.
+     * 
+     * Rules run highest ceiling first, stopping once none left can beat
+     * the leader or tie it from an earlier position.
+     */
+    const name = (fieldName || '').toLowerCase();
+    let best = this._ruleFuncs.length;
+    let confidence = 0.0;
+    
+    for (let k = 0; k < this._searchOrder.length; k++) {
+      const i = this._searchOrder[k];
+      const ceiling = this._ceilings[i];
+      if (ceiling < confidence || (ceiling === confidence && i > best)) {
+        break;
+      }
+      const conf = this._ruleFuncs[i](name, fieldType, fieldValue, fieldName);
+      if (conf > confidence || (conf === confidence && conf > 0 && i < best)) {
+        confidence = conf;
+        best = i;
+      }
+    }
+    
+    return { best, confidence };
+  }
+
+  _semanticAt(index) {
+    /**
+     * The semantic type for a rule index, 'default' past the last rule
+     */
+    return index < this._ruleTypes.length ? this._ruleTypes[index] : 'default';
+  }
+
+  _renderInstruction(index, context) {
+    /**
+     * Look up how the semantic at a rule index renders in a context
+     */
+    return this._renderTable[index].get(context) || 'text:plain';
   }
 
   batchAnalyze(fields, context = 'list') {
@@ -321,18 +752,30 @@ class SemanticProtocol {
      */
     const results = {};
     
+    // Field by field on purpose: the rules for one field share a single
+    // keyword scan of its name, which a rule-by-rule pass over the whole
+    // batch would repeat for every rule. Repeated fields hit the cache.
     for (const field of fields) {
-      let name, type, value;
-      
-      if (typeof field === 'object' && field !== null) {
-        name = field.name || 'unknown';
-        type = field.type || 'string';
-        value = field.value;
-      } else {
-        name = String(field);
-        type = 'string';
-        value = null;
-      }
+      const { name, type, value } = fieldSpec(field);
+      results[name] = this.analyze(name, type, value, context);
+    }
+    
+    return results;
+  }
+
+  batchAnalyzeColumns(names, types = [], values = [], context = 'list') {
+    /**
+     * Analyze a schema given as parallel arrays of names, types and values,
+     * without a field object per entry. Names are converted with String(),
+     * and a missing name becomes 'unknown'. Missing types default to
+     * 'string' and missing values to null, as in batchAnalyze.
+     */
+    const results = {};
+    
+    for (let i = 0; i < names.length; i++) {
+      const name = names[i] === null || names[i] === undefined ? 'unknown' : String(names[i]);
+      const type = types[i] || 'string';
+      const value = i < values.length ? values[i] : null;
       
       results[name] = this.analyze(name, type, value, context);
     }
@@ -340,23 +783,59 @@ class SemanticProtocol {
     return results;
   }
 
+  compileSchema(fields) {
+    /**
+     * Analyze a fixed schema once for every supported context and return
+     * a lookup (fieldName, context = 'list') => SemanticResult.
+     * 
+     * Fields are given as for batchAnalyze. Names outside the schema are
+     * analyzed as strings, and other contexts are analyzed on demand. The
+     * table is rebuilt on the first lookup after the rules change.
+     */
+    const schema = fields.map(fieldSpec);
+    let table, version;
+    
+    const build = () => {
+      const contexts = this.getSupportedContexts();
+      table = new Map();
+      for (const { name, type, value } of schema) {
+        const byContext = new Map();
+        for (const context of contexts) {
+          byContext.set(context, this.analyze(name, type, value, context));
+        }
+        table.set(name, { type, value, byContext });
+      }
+      version = this._version;
+    };
+    build();
+    
+    return (fieldName, context = 'list') => {
+      this._refresh();
+      if (version !== this._version) {
+        build();
+      }
+      const entry = table.get(fieldName);
+      if (entry === undefined) {
+        return this.analyze(fieldName, 'string', null, context);
+      }
+      return entry.byContext.get(context) || this.analyze(fieldName, entry.type, entry.value, context);
+    };
+  }
+
   getSupportedSemantics() {
     /**
      * List all supported semantic types
      */
-    return Object.keys(this.semanticRules);
+    this._refresh();
+    return this._ruleTypes.slice();
   }
 
   getSupportedContexts() {
     /**
      * List all supported rendering contexts
      */
-    const contexts = new Set();
-    for (const key of Object.keys(this.renderMap)) {
-      const context = key.split(':')[1];
-      contexts.add(context);
-    }
-    return Array.from(contexts).sort();
+    this._refresh();
+    return this._contexts.slice();
   }
 }
 
@@ -367,27 +846,25 @@ class SemanticProtocol {
 // Global instance for simple usage
 const protocol = new SemanticProtocol();
 
-function analyze(fieldName, fieldType = 'string', fieldValue = null, context = 'list') {
+function analyze(fieldName, fieldType = 'string', fieldValue = null, context = 'list', includeMatches = true) {
   /**
    * Quick analysis using the global protocol instance
    */
-  return protocol.analyze(fieldName, fieldType, fieldValue, context);
+  return protocol.analyze(fieldName, fieldType, fieldValue, context, includeMatches);
 }
 
 function identify(fieldName, fieldType = 'string') {
   /**
    * Just get the semantic type
    */
-  const result = protocol.analyze(fieldName, fieldType);
-  return result.semanticType;
+  return protocol.identify(fieldName, fieldType);
 }
 
 function render(fieldName, fieldType = 'string', context = 'list') {
   /**
    * Just get the render instruction
    */
-  const result = protocol.analyze(fieldName, fieldType, null, context);
-  return result.renderInstruction;
+  return protocol.render(fieldName, fieldType, context);
 }
 
 // ============================================================================
@@ -79,6 +79,153 @@ export interface FieldDefinition {
   description?: string;
 }
 
+// Name suffixes that imply a semantic on their own, compiled once at load
+const SUFFIX_PATTERNS: Partial<Record<SemanticType, { suffix: string; confidence: number; reason: string }>> = {
+  temporal: { suffix: '_at', confidence: 90, reason: "Field ends with '_at' (temporal pattern)" },
+  identifier: { suffix: '_id', confidence: 90, reason: "Field ends with '_id' (identifier pattern)" },
+  percentage: { suffix: '_rate', confidence: 85, reason: "Field ends with '_rate' (percentage pattern)" }
+};
+
+// Every suffix is a single '_word', so the segment after a name's last
+// underscore identifies the matching suffix with one lookup
+const SUFFIX_SEMANTICS = new Map(
+  (Object.entries(SUFFIX_PATTERNS) as [SemanticType, { suffix: string }][]).map(([semantic, { suffix }]) => [suffix, semantic])
+);
+
+// URL values are checked the same way in both ports: a first-character guard
+// (see valueShape) rejects most values with one compare, and the rest go
+// through one anchored, precompiled regex. In V8 that regex is clearly faster
+// than the startsWith('http://') / startsWith('https://') pair this check
+// would need, and within a few nanoseconds of the single startsWith() the JS
+// port's check would need, so both ports use it.
+const URL_SCHEME_PATTERN = /^https?:\/\//;
+const CHAR_H = 0x68;
+
+// Value shape bits, computed once per field
+const VALUE_EMAIL = 1;
+const VALUE_URL = 2;
+const VALUE_UNIT_INTERVAL = 4;
+
+// Value patterns, keyed by the semantic they support
+const VALUE_PATTERNS: Partial<Record<SemanticType, { shape: number; confidence: number; reason: string }>> = {
+  email: { shape: VALUE_EMAIL, confidence: 90, reason: "Value contains '@' (email pattern)" },
+  url: { shape: VALUE_URL, confidence: 90, reason: 'Value starts with http(s):// (URL pattern)' },
+  percentage: { shape: VALUE_UNIT_INTERVAL, confidence: 70, reason: 'Value between 0-1 (percentage pattern)' }
+};
+
+// One rule with everything it checks resolved up front
+interface CompiledRule {
+  index: number;
+  semantic: SemanticType;
+  keywords: string[];
+  keywordConfidence: number;
+  types: ReadonlySet<DataType>;
+  typeConfidence: number;
+  suffix?: { suffix: string; confidence: number; reason: string };
+  value?: { shape: number; confidence: number; reason: string };
+  maxConfidence: number;
+}
+
+// Everything rule scoring needs from a field name
+interface NameProfile {
+  keywordHits: Map<SemanticType, number>;
+  suffixSemantic: SemanticType | undefined;
+  // Rules fired by a keyword or suffix hit
+  mask: number;
+}
+
+// Winning column of each row of a confidence matrix, or -1 when the row's
+// best is below threshold. Ties go to the lower column (declaration
+// order). Kept a flat loop over typed arrays so V8 compiles it to a
+// tight monomorphic native loop.
+function pickWinners(matrix: Uint8Array, width: number, threshold: number): Int8Array {
+  const rows = width === 0 ? 0 : matrix.length / width;
+  const winners = new Int8Array(rows).fill(-1);
+
+  for (let row = 0, offset = 0; row < rows; row++, offset += width) {
+    let best = 0;
+    for (let column = 0; column < width; column++) {
+      if (matrix[offset + column] > best) {
+        best = matrix[offset + column];
+        winners[row] = column;
+      }
+    }
+    if (best < threshold) {
+      winners[row] = -1;
+    }
+  }
+
+  return winners;
+}
+
+// Aho-Corasick automaton over every rule keyword, so a field name is
+// scanned once no matter how many rules and keywords are registered
+class KeywordAutomaton {
+  private readonly transitions: Map<string, number>[] = [new Map()];
+  private readonly failure: number[] = [0];
+  private readonly outputs: { semantic: SemanticType; index: number }[][] = [[]];
+
+  constructor(keywords: Record<SemanticType, { keywords: string[] }>) {
+    for (const [semantic, rules] of Object.entries(keywords) as [SemanticType, { keywords: string[] }][]) {
+      rules.keywords.forEach((keyword, index) => {
+        let state = 0;
+        for (const char of keyword) {
+          let next = this.transitions[state].get(char);
+          if (next === undefined) {
+            next = this.transitions.length;
+            this.transitions.push(new Map());
+            this.failure.push(0);
+            this.outputs.push([]);
+            this.transitions[state].set(char, next);
+          }
+          state = next;
+        }
+        this.outputs[state].push({ semantic, index });
+      });
+    }
+
+    // Breadth-first failure links; each state inherits its fallback's outputs
+    const queue = Array.from(this.transitions[0].values());
+    for (let i = 0; i < queue.length; i++) {
+      const state = queue[i];
+      for (const [char, next] of this.transitions[state]) {
+        let fallback = this.failure[state];
+        while (fallback !== 0 && !this.transitions[fallback].has(char)) {
+          fallback = this.failure[fallback];
+        }
+        this.failure[next] = this.transitions[fallback].get(char) ?? 0;
+        this.outputs[next] = this.outputs[next].concat(this.outputs[this.failure[next]]);
+        queue.push(next);
+      }
+    }
+  }
+
+  /**
+   * Returns, per semantic, the index of its first-listed keyword found in text
+   */
+  scan(text: string): Map<SemanticType, number> {
+    const hits = new Map<SemanticType, number>();
+    let state = 0;
+
+    for (let i = 0; i < text.length; i++) {
+      const char = text[i];
+      while (state !== 0 && !this.transitions[state].has(char)) {
+        state = this.failure[state];
+      }
+      state = this.transitions[state].get(char) ?? 0;
+
+      for (const { semantic, index } of this.outputs[state]) {
+        const previous = hits.get(semantic);
+        if (previous === undefined || index < previous) {
+          hits.set(semantic, index);
+        }
+      }
+    }
+
+    return hits;
+  }
+}
+
 // Semantic Rules with Type Safety
 export class SemanticRules {
   private static readonly PATTERNS: Record<SemanticType, {
@@ -138,77 +285,301 @@ export class SemanticRules {
     }
   };
 
+  // Rule declaration order; also the column order of scoreMatrix()
+  static readonly SEMANTICS = Object.keys(SemanticRules.PATTERNS) as readonly SemanticType[];
+
+  private static readonly KEYWORDS = new KeywordAutomaton(SemanticRules.PATTERNS);
+
+  // PATTERNS merged with the suffix and value tables once, in declaration
+  // order, so scoring walks an array instead of doing keyed lookups per rule
+  private static readonly RULES: readonly CompiledRule[] = SemanticRules.SEMANTICS.map((semantic, index) =>
+    SemanticRules.compile(semantic, index)
+  );
+
+  // Rules ordered by the highest confidence they can produce (ties keep
+  // declaration order), so best() can stop once no remaining rule can win
+  private static readonly BY_MAX_CONFIDENCE: readonly CompiledRule[] = SemanticRules.RULES
+    .slice()
+    .sort((a, b) => b.maxConfidence - a.maxConfidence || a.index - b.index);
+
+  // Rule bitmasks (bit i = RULES[i]) of the rules each precondition can
+  // fire, so rules none of whose checks can pass are never scored
+  private static readonly TYPE_MASKS = SemanticRules.RULES.reduce((masks, rule) => {
+    rule.types.forEach(type => masks.set(type, (masks.get(type) ?? 0) | (1 << rule.index)));
+    return masks;
+  }, new Map<DataType, number>());
+
+  private static readonly VALUE_MASKS = Array.from(
+    { length: (VALUE_EMAIL | VALUE_URL | VALUE_UNIT_INTERVAL) + 1 },
+    (_, shape) => SemanticRules.RULES.reduce(
+      (mask, rule) => (rule.value && shape & rule.value.shape ? mask | (1 << rule.index) : mask),
+      0
+    )
+  );
+
+  private static readonly RULE_BITS = Object.fromEntries(
+    SemanticRules.RULES.map(rule => [rule.semantic, 1 << rule.index])
+  ) as Record<SemanticType, number>;
+
   static analyze(field: FieldDefinition): SemanticMatch[] {
-    const matches: SemanticMatch[] = [];
-    const fieldLower = field.name.toLowerCase();
-
-    for (const [semantic, rules] of Object.entries(this.PATTERNS) as [SemanticType, typeof this.PATTERNS[SemanticType]][]) {
-      let confidence = 0;
-      const reasons: string[] = [];
-
-      // Check keywords
-      for (const keyword of rules.keywords) {
-        if (fieldLower.includes(keyword)) {
-          confidence = Math.max(confidence, rules.confidence.keyword);
-          reasons.push(`Field name contains '${keyword}'`);
-          break;
-        }
-      }
+    return this.evaluate(field.name, field.type, this.valueShape(field.value));
+  }
 
-      // Check suffixes
-      if (fieldLower.endsWith('_at') && semantic === 'temporal') {
-        confidence = Math.max(confidence, 90);
-        reasons.push("Field ends with '_at' (temporal pattern)");
+  /**
+   * analyze() for every field of a schema. Rule results depend only on name,
+   * type and the shape of the value, so fields repeating an earlier one get
+   * a copy of its matches instead of being re-evaluated. Repeats are only
+   * looked for within one call: a cache shared across calls made every
+   * field with a new name pay for a key and an insert.
+   */
+  static analyzeSchema(fields: FieldDefinition[]): SemanticMatch[][] {
+    const seen = new Map<string, SemanticMatch[]>();
+
+    return fields.map(field => {
+      const shape = this.valueShape(field.value);
+      const key = this.fieldKey(field, shape);
+      const matches = seen.get(key);
+      if (matches) {
+        return matches.slice();
       }
-      if (fieldLower.endsWith('_id') && semantic === 'identifier') {
-        confidence = Math.max(confidence, 90);
-        reasons.push("Field ends with '_id' (identifier pattern)");
+
+      const evaluated = this.evaluate(field.name, field.type, shape);
+      seen.set(key, evaluated);
+      return evaluated;
+    });
+  }
+
+  /**
+   * The top match analyze() would return, without evaluating rules that
+   * can no longer beat it
+   */
+  static best(field: FieldDefinition): SemanticMatch | null {
+    const shape = this.valueShape(field.value);
+    const profile = this.profile(field.name);
+    const candidates = this.candidates(profile, field.type, shape);
+    let bestConfidence = 0;
+    let bestIndex = -1;
+
+    for (const rule of this.BY_MAX_CONFIDENCE) {
+      if (bestConfidence > rule.maxConfidence ||
+          (bestConfidence === rule.maxConfidence && bestIndex < rule.index)) {
+        break;
       }
-      if (fieldLower.endsWith('_rate') && semantic === 'percentage') {
-        confidence = Math.max(confidence, 85);
-        reasons.push("Field ends with '_rate' (percentage pattern)");
+      if (!(candidates & (1 << rule.index))) {
+        continue;
       }
 
-      // Check data type
-      if (rules.types && rules.types.includes(field.type)) {
-        confidence = Math.max(confidence, rules.confidence.type);
-        reasons.push(`Data type '${field.type}' matches semantic`);
+      const confidence = this.score(rule, profile, field.type, shape);
+      if (confidence > bestConfidence || (confidence === bestConfidence && rule.index < bestIndex)) {
+        bestConfidence = confidence;
+        bestIndex = rule.index;
       }
+    }
 
-      // Check value patterns
-      if (field.value !== undefined) {
-        if (semantic === 'email' && typeof field.value === 'string' && field.value.includes('@')) {
-          confidence = Math.max(confidence, 90);
-          reasons.push("Value contains '@' (email pattern)");
-        }
-        if (semantic === 'url' && typeof field.value === 'string' && 
-            (field.value.startsWith('http://') || field.value.startsWith('https://'))) {
-          confidence = Math.max(confidence, 90);
-          reasons.push("Value starts with http(s):// (URL pattern)");
-        }
-        if (semantic === 'percentage' && typeof field.value === 'number' && 
-            field.value >= 0 && field.value <= 1) {
-          confidence = Math.max(confidence, 70);
-          reasons.push("Value between 0-1 (percentage pattern)");
-        }
-      }
+    if (bestIndex < 0) {
+      return null;
+    }
+    return this.describe(
+      this.RULES[bestIndex], bestConfidence, profile, field.type, shape
+    );
+  }
 
-      if (confidence > 0) {
-        matches.push({
-          semantic,
-          confidence,
-          reason: reasons.join('; ')
-        });
+  /**
+   * Confidence of every rule for a batch of fields, row-major: the row for
+   * fields[i] starts at i * SEMANTICS.length. Fields repeating an earlier
+   * name, type and value shape copy that row instead of being re-scored.
+   */
+  static scoreMatrix(fields: FieldDefinition[]): Uint8Array {
+    const width = this.SEMANTICS.length;
+    const matrix = new Uint8Array(fields.length * width);
+    const rows = new Map<string, number>();
+
+    for (let i = 0; i < fields.length; i++) {
+      const field = fields[i];
+      const shape = this.valueShape(field.value);
+      const key = this.fieldKey(field, shape);
+      const offset = i * width;
+
+      const seen = rows.get(key);
+      if (seen !== undefined) {
+        matrix.copyWithin(offset, seen, seen + width);
+        continue;
+      }
+      rows.set(key, offset);
+
+      const profile = this.profile(field.name);
+      let candidates = this.candidates(profile, field.type, shape);
+      while (candidates !== 0) {
+        const j = 31 - Math.clz32(candidates & -candidates);
+        matrix[offset + j] = this.score(this.RULES[j], profile, field.type, shape);
+        candidates &= candidates - 1;
       }
     }
 
-    return matches.sort((a, b) => b.confidence - a.confidence);
+    return matrix;
+  }
+
+  // Fields with equal keys score identically
+  private static fieldKey(field: FieldDefinition, shape: number): string {
+    return `${field.name}\u0000${field.type}\u0000${shape}`;
+  }
+
+  // Lowercases the name and scans it once for every rule's keywords and
+  // suffix. Not memoized: keying a table on the name costs about as much as
+  // the single automaton pass it would save.
+  private static profile(name: string): NameProfile {
+    const fieldLower = name.toLowerCase();
+    const keywordHits = this.KEYWORDS.scan(fieldLower);
+    const suffixSemantic = SUFFIX_SEMANTICS.get(fieldLower.slice(fieldLower.lastIndexOf('_')));
+    let mask = suffixSemantic ? this.RULE_BITS[suffixSemantic] : 0;
+    for (const semantic of keywordHits.keys()) {
+      mask |= this.RULE_BITS[semantic];
+    }
+
+    return { keywordHits, suffixSemantic, mask };
+  }
+
+  private static compile(semantic: SemanticType, index: number): CompiledRule {
+    const { keywords, types, confidence } = this.PATTERNS[semantic];
+    const suffix = SUFFIX_PATTERNS[semantic];
+    const value = VALUE_PATTERNS[semantic];
+
+    return {
+      index,
+      semantic,
+      keywords,
+      keywordConfidence: confidence.keyword,
+      types: new Set(types),
+      typeConfidence: confidence.type,
+      suffix,
+      value,
+      maxConfidence: Math.max(confidence.keyword, confidence.type, suffix?.confidence ?? 0, value?.confidence ?? 0)
+    };
+  }
+
+  // Which of the value patterns a value satisfies; values with the same
+  // shape always produce the same matches. Rules dispatch on these bits
+  // instead of re-testing the value. The checks are deliberately not merged
+  // into one capturing alternation: in V8 that exec is slower than a
+  // memchr-style includes() plus an anchored test().
+  private static valueShape(value: any): number {
+    if (typeof value === 'string') {
+      // Most values don't start with 'h', which rules out a URL before
+      // the regex is entered at all
+      const url = value.charCodeAt(0) === CHAR_H && URL_SCHEME_PATTERN.test(value);
+      return (value.includes('@') ? VALUE_EMAIL : 0) | (url ? VALUE_URL : 0);
+    }
+    if (typeof value === 'number' && value >= 0 && value <= 1) {
+      return VALUE_UNIT_INTERVAL;
+    }
+    return 0;
+  }
+
+  private static evaluate(name: string, type: DataType, shape: number): SemanticMatch[] {
+    const profile = this.profile(name);
+
+    // Score into a flat array and sort rule indexes; match objects and
+    // reason strings are only built for rules that fired, already in order.
+    // Every candidate has at least one passing check, so every one fires.
+    const confidences = new Uint8Array(this.RULES.length);
+    const fired: number[] = [];
+    let candidates = this.candidates(profile, type, shape);
+    while (candidates !== 0) {
+      const i = 31 - Math.clz32(candidates & -candidates);
+      confidences[i] = this.score(this.RULES[i], profile, type, shape);
+      fired.push(i);
+      candidates &= candidates - 1;
+    }
+    fired.sort((a, b) => confidences[b] - confidences[a] || a - b);
+
+    return fired.map(i =>
+      this.describe(this.RULES[i], confidences[i], profile, type, shape)
+    );
+  }
+
+  // Bitmask of the rules with at least one check that passes for this field
+  private static candidates(profile: NameProfile, type: DataType, shape: number): number {
+    return profile.mask | (this.TYPE_MASKS.get(type) ?? 0) | this.VALUE_MASKS[shape];
+  }
+
+  private static score(
+    rule: CompiledRule,
+    profile: NameProfile,
+    type: DataType,
+    shape: number
+  ): number {
+    let confidence = 0;
+
+    // Check keywords
+    if (profile.keywordHits.has(rule.semantic)) {
+      confidence = rule.keywordConfidence;
+    }
+
+    // Check suffixes
+    if (rule.suffix && profile.suffixSemantic === rule.semantic) {
+      confidence = Math.max(confidence, rule.suffix.confidence);
+    }
+
+    // Check data type
+    if (rule.types.has(type)) {
+      confidence = Math.max(confidence, rule.typeConfidence);
+    }
+
+    // Check value patterns
+    if (rule.value && shape & rule.value.shape) {
+      confidence = Math.max(confidence, rule.value.confidence);
+    }
+
+    return confidence;
+  }
+
+  // The match object for a rule that fired, with every check that hit
+  private static describe(
+    rule: CompiledRule,
+    confidence: number,
+    profile: NameProfile,
+    type: DataType,
+    shape: number
+  ): SemanticMatch {
+    const reasons: string[] = [];
+
+    const keywordIndex = profile.keywordHits.get(rule.semantic);
+    if (keywordIndex !== undefined) {
+      reasons.push(`Field name contains '${rule.keywords[keywordIndex]}'`);
+    }
+    if (rule.suffix && profile.suffixSemantic === rule.semantic) {
+      reasons.push(rule.suffix.reason);
+    }
+    if (rule.types.has(type)) {
+      reasons.push(`Data type '${type}' matches semantic`);
+    }
+    if (rule.value && shape & rule.value.shape) {
+      reasons.push(rule.value.reason);
+    }
+
+    return Object.freeze({
+      semantic: rule.semantic,
+      confidence,
+      reason: reasons.join('; ')
+    });
   }
 }
 
+// Render tables are shared by every analysis, so freeze them down to the props
+function freezeTable<T extends Record<string, Record<string, RenderInstruction>>>(table: T): T {
+  for (const contexts of Object.values(table)) {
+    for (const instruction of Object.values(contexts)) {
+      if (instruction.props) Object.freeze(instruction.props);
+      Object.freeze(instruction);
+    }
+    Object.freeze(contexts);
+  }
+  return Object.freeze(table);
+}
+
 // Render Mapping with Type Safety
 export class RenderMap {
-  private static readonly MAPPINGS: Record<SemanticType, Record<RenderContext, RenderInstruction>> = {
+  private static readonly MAPPINGS: Record<SemanticType, Record<RenderContext, RenderInstruction>> = freezeTable({
     cancellation: {
       list: { component: 'badge', variant: 'danger', props: { size: 'sm' } },
       detail: { component: 'alert', variant: 'warning' },
@@ -269,42 +640,44 @@ export class RenderMap {
       form: { component: 'toggle', variant: 'danger' },
       timeline: { component: 'event', variant: 'error' }
     }
-  };
+  });
 
   static getRenderInstruction(semantic: SemanticType, context: RenderContext): RenderInstruction {
     return this.MAPPINGS[semantic][context];
   }
 
+  private static readonly DEFAULTS = freezeTable({
+    string: {
+      list: { component: 'text' },
+      detail: { component: 'text' },
+      form: { component: 'input', variant: 'text' },
+      timeline: { component: 'text' }
+    },
+    number: {
+      list: { component: 'text', variant: 'number' },
+      detail: { component: 'text', variant: 'number' },
+      form: { component: 'input', variant: 'number' },
+      timeline: { component: 'metric' }
+    },
+    boolean: {
+      list: { component: 'badge', variant: 'boolean' },
+      detail: { component: 'indicator' },
+      form: { component: 'toggle' },
+      timeline: { component: 'state' }
+    },
+    date: {
+      list: { component: 'text', variant: 'date' },
+      detail: { component: 'text', variant: 'date' },
+      form: { component: 'datepicker' },
+      timeline: { component: 'timestamp' }
+    },
+    // ... other types follow similar pattern
+  } as Record<DataType, Record<RenderContext, RenderInstruction>>);
+
+  private static readonly FALLBACK: RenderInstruction = Object.freeze({ component: 'text' });
+
   static getDefault(dataType: DataType, context: RenderContext): RenderInstruction {
-    const defaults: Record<DataType, Record<RenderContext, RenderInstruction>> = {
-      string: {
-        list: { component: 'text' },
-        detail: { component: 'text' },
-        form: { component: 'input', variant: 'text' },
-        timeline: { component: 'text' }
-      },
-      number: {
-        list: { component: 'text', variant: 'number' },
-        detail: { component: 'text', variant: 'number' },
-        form: { component: 'input', variant: 'number' },
-        timeline: { component: 'metric' }
-      },
-      boolean: {
-        list: { component: 'badge', variant: 'boolean' },
-        detail: { component: 'indicator' },
-        form: { component: 'toggle' },
-        timeline: { component: 'state' }
-      },
-      date: {
-        list: { component: 'text', variant: 'date' },
-        detail: { component: 'text', variant: 'date' },
-        form: { component: 'datepicker' },
-        timeline: { component: 'timestamp' }
-      },
-      // ... other types follow similar pattern
-    } as Record<DataType, Record<RenderContext, RenderInstruction>>;
-
-    return defaults[dataType]?.[context] || { component: 'text' };
+    return this.DEFAULTS[dataType]?.[context] || this.FALLBACK;
   }
 }
 
@@ -317,8 +690,16 @@ export class SemanticProtocol {
   }
 
   analyze(field: FieldDefinition, context: RenderContext = 'list'): AnalysisResult {
-    const semantics = SemanticRules.analyze(field);
-    const bestMatch = semantics.find(s => s.confidence >= this.confidenceThreshold) || null;
+    return this.toResult(field, SemanticRules.analyze(field), context);
+  }
+
+  private toResult(field: FieldDefinition, semantics: SemanticMatch[], context: RenderContext): AnalysisResult {
+    // Matches come sorted by confidence, so the accepted ones are a prefix
+    let accepted = 0;
+    while (accepted < semantics.length && semantics[accepted].confidence >= this.confidenceThreshold) {
+      accepted++;
+    }
+    const bestMatch = accepted > 0 ? semantics[0] : null;
     
     const renderInstruction = bestMatch
       ? RenderMap.getRenderInstruction(bestMatch.semantic, context)
@@ -327,7 +708,7 @@ export class SemanticProtocol {
     return {
       field: field.name,
       dataType: field.type,
-      semantics: semantics.filter(s => s.confidence >= this.confidenceThreshold),
+      semantics: semantics.slice(0, accepted),
       bestMatch,
       context,
       renderInstruction,
@@ -340,7 +721,25 @@ export class SemanticProtocol {
   }
 
   analyzeSchema(fields: FieldDefinition[], context: RenderContext = 'list'): AnalysisResult[] {
-    return fields.map(field => this.analyze(field, context));
+    const semantics = SemanticRules.analyzeSchema(fields);
+    return fields.map((field, i) => this.toResult(field, semantics[i], context));
+  }
+
+  // Just the winning semantic, skipping rules that can't beat the leader
+  identify(field: FieldDefinition): SemanticType | null {
+    const best = SemanticRules.best(field);
+    return best && best.confidence >= this.confidenceThreshold ? best.semantic : null;
+  }
+
+  // identify() for a whole schema, scored as one confidence matrix
+  identifySchema(fields: FieldDefinition[]): (SemanticType | null)[] {
+    const winners = pickWinners(
+      SemanticRules.scoreMatrix(fields),
+      SemanticRules.SEMANTICS.length,
+      this.confidenceThreshold
+    );
+
+    return Array.from(winners, winner => (winner >= 0 ? SemanticRules.SEMANTICS[winner] : null));
   }
 
   // Type-safe builder pattern for field definitions
@@ -2,7 +2,10 @@ module.exports = {
   projects: [
     {
       displayName: 'core',
-      testMatch: ['<rootDir>/unit/core/**/*.test.js'],
+      testMatch: ['<rootDir>/unit/core/**/*.test.{js,ts}'],
+      transform: {
+        '^.+\\.ts$': 'ts-jest'
+      },
       coverageDirectory: '<rootDir>/coverage/core',
       collectCoverageFrom: [
         'packages/core/src/**/*.js',
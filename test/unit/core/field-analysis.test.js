@@ -0,0 +1,274 @@
+const { SemanticProtocol, SemanticResult, render } = require('../../../semantic-protocol.js');
+const { fields, contexts } = require('../../fixtures/fields.json');
+
+function summary(result) {
+  return {
+    semanticType: result.semanticType,
+    renderInstruction: result.renderInstruction,
+    confidence: result.confidence,
+    metadata: result.metadata,
+  };
+}
+
+describe('JS SemanticProtocol', () => {
+  let protocol;
+
+  beforeEach(() => {
+    protocol = new SemanticProtocol();
+  });
+
+  describe('Shortcuts', () => {
+    test('identify() agrees with analyze()', () => {
+      for (const { name, type, value } of fields) {
+        expect(protocol.identify(name, type, value)).toBe(protocol.analyze(name, type, value).semanticType);
+      }
+      expect(protocol.identify('user_email')).toBe('email');
+      expect(protocol.identify('description')).toBe('default');
+    });
+
+    test('render() agrees with analyze()', () => {
+      for (const { name, type, value } of fields) {
+        for (const context of contexts) {
+          expect(protocol.render(name, type, context, value))
+            .toBe(protocol.analyze(name, type, value, context).renderInstruction);
+        }
+      }
+    });
+
+    test('render() takes the context third, like the module-level render()', () => {
+      expect(protocol.render('user_email', 'string', 'detail')).toBe('link:email-full');
+      expect(protocol.render('user_email', 'string', 'detail')).toBe(render('user_email', 'string', 'detail'));
+      expect(protocol.render('user_email')).toBe('link:email');
+    });
+  });
+
+  describe('Batches', () => {
+    test('batchAnalyzeColumns() matches batchAnalyze()', () => {
+      const named = fields.filter(field => field.name);
+      const names = named.map(field => field.name);
+      const types = named.map(field => field.type);
+      const values = named.map(field => (field.value === undefined ? null : field.value));
+
+      for (const context of contexts) {
+        expect(protocol.batchAnalyzeColumns(names, types, values, context))
+          .toEqual(protocol.batchAnalyze(named, context));
+      }
+      expect(protocol.batchAnalyzeColumns(['user_email', 'created_at']))
+        .toEqual(protocol.batchAnalyze(['user_email', 'created_at']));
+    });
+
+    test('batchAnalyzeColumns() accepts non-string names', () => {
+      expect(Object.keys(protocol.batchAnalyzeColumns([5, true]))).toEqual(Object.keys(protocol.batchAnalyze([5, true])));
+      expect(protocol.batchAnalyzeColumns([5])['5']).toEqual(protocol.batchAnalyze([5])['5']);
+      expect(Object.keys(protocol.batchAnalyzeColumns([null, undefined, '']))).toEqual(['unknown', '']);
+    });
+  });
+
+  describe('Compiled schemas', () => {
+    test('compileSchema() lookups match analyze()', () => {
+      const schema = fields.slice(0, 6);
+      const lookup = protocol.compileSchema(schema);
+
+      for (const { name, type, value } of schema) {
+        for (const context of contexts) {
+          expect(summary(lookup(name, context))).toEqual(summary(protocol.analyze(name, type, value, context)));
+        }
+      }
+      expect(lookup('user_id')).toBe(lookup('user_id', 'list'));
+    });
+
+    test('compileSchema() falls back for unknown names and contexts', () => {
+      const lookup = protocol.compileSchema([{ name: 'user_email', type: 'string', value: 'a@b.com' }]);
+
+      expect(summary(lookup('created_at', 'detail')))
+        .toEqual(summary(protocol.analyze('created_at', 'string', null, 'detail')));
+      expect(summary(lookup('user_email', 'unknown')))
+        .toEqual(summary(protocol.analyze('user_email', 'string', 'a@b.com', 'unknown')));
+      expect(lookup('user_email', 'unknown').renderInstruction).toBe('text:plain');
+    });
+
+    test('compileSchema() lookups follow rule changes', () => {
+      const lookup = protocol.compileSchema(['lat_lng', 'user_email']);
+      expect(lookup('lat_lng').semanticType).toBe('default');
+
+      protocol.semanticRules.geo = field => (field.name === 'lat_lng' ? 0.99 : 0);
+      protocol.renderMap['geo:list'] = 'map:pin';
+      expect(lookup('lat_lng').toString()).toBe('geo → map:pin (99%)');
+      expect(lookup('user_email').semanticType).toBe('email');
+    });
+  });
+
+  describe('Cache', () => {
+    test('cached results equal fresh ones', () => {
+      for (const { name, type, value } of fields) {
+        for (const context of contexts) {
+          const first = protocol.analyze(name, type, value, context);
+          const fresh = new SemanticProtocol().analyze(name, type, value, context);
+          expect(protocol.analyze(name, type, value, context)).toBe(first);
+          expect(summary(first)).toEqual(summary(fresh));
+        }
+      }
+    });
+
+    test('values of the same shape share an entry', () => {
+      const first = protocol.analyze('completion_rate', 'number', 0.25);
+      expect(protocol.analyze('completion_rate', 'number', 0.75)).toBe(first);
+      expect(protocol.analyze('completion_rate', 'number', 75)).not.toBe(first);
+      expect(protocol.analyze('contact', 'string', { nested: true }).semanticType).toBe('default');
+    });
+
+    test('custom rules are cached per value', () => {
+      protocol.registerRule('big', field => (field.value > 100 ? 0.99 : 0));
+
+      expect(protocol.analyze('amount', 'number', 500).semanticType).toBe('big');
+      expect(protocol.analyze('amount', 'number', 5).semanticType).toBe('currency');
+    });
+
+    test('results are frozen', () => {
+      const result = protocol.analyze('user_email', 'string', 'a@b.com');
+      expect(Object.isFrozen(result)).toBe(true);
+      expect(Object.isFrozen(result.metadata)).toBe(true);
+      expect(Object.isFrozen(result.metadata.allMatches)).toBe(true);
+    });
+
+    test('SemanticResult can be subclassed', () => {
+      class TaggedResult extends SemanticResult {
+        constructor(...args) {
+          super(...args);
+          this.tag = 'custom';
+        }
+      }
+
+      const result = new TaggedResult('email', 'link:email', 0.95, {});
+      expect(result.tag).toBe('custom');
+      expect(result.toString()).toBe('email → link:email (95%)');
+    });
+
+    test('compile() and clearCache() drop cached results', () => {
+      const first = protocol.analyze('user_email');
+
+      protocol.clearCache();
+      const afterClear = protocol.analyze('user_email');
+      expect(afterClear).not.toBe(first);
+      expect(summary(afterClear)).toEqual(summary(first));
+
+      protocol.compile();
+      expect(protocol.analyze('user_email')).not.toBe(afterClear);
+    });
+  });
+
+  describe('Compiled rules', () => {
+    test('changes to semanticRules apply without compile()', () => {
+      expect(protocol.analyze('lat_lng').semanticType).toBe('default');
+
+      protocol.semanticRules.geo = field => (field.name === 'lat_lng' ? 0.99 : 0);
+      expect(protocol.analyze('lat_lng').semanticType).toBe('geo');
+      expect(protocol.identify('lat_lng')).toBe('geo');
+      expect(protocol.getSupportedSemantics()).toContain('geo');
+
+      delete protocol.semanticRules.geo;
+      expect(protocol.analyze('lat_lng').semanticType).toBe('default');
+      expect(protocol.getSupportedSemantics()).not.toContain('geo');
+    });
+
+    test('changes to renderMap apply without compile()', () => {
+      expect(protocol.analyze('user_email').renderInstruction).toBe('link:email');
+
+      protocol.renderMap['email:list'] = 'link:mailto';
+      protocol.renderMap['email:card'] = 'link:compact';
+      expect(protocol.analyze('user_email').renderInstruction).toBe('link:mailto');
+      expect(protocol.render('user_email', 'string', 'card')).toBe('link:compact');
+      expect(protocol.getSupportedContexts()).toContain('card');
+
+      protocol.renderMap = { 'email:list': 'text:plain-email' };
+      expect(protocol.analyze('user_email').renderInstruction).toBe('text:plain-email');
+      expect(protocol.getSupportedContexts()).toEqual(['list']);
+    });
+
+    test('an assigned table is used in place, not copied', () => {
+      const rules = { ...protocol.semanticRules };
+      protocol.semanticRules = rules;
+      expect(protocol.identify('lat_lng')).toBe('default');
+
+      rules.geo = field => (field.name === 'lat_lng' ? 0.99 : 0);
+      protocol.compile();
+      expect(protocol.identify('lat_lng')).toBe('geo');
+
+      protocol.semanticRules.lng = field => (field.name === 'lng' ? 0.99 : 0);
+      expect(rules.lng).toBe(protocol.semanticRules.lng);
+      expect(protocol.identify('lng')).toBe('lng');
+    });
+
+    test('built-in rules keep the field-object contract', () => {
+      const email = protocol.semanticRules.email;
+      expect(email({ name: 'user_email' })).toBe(0.95);
+      expect(email({ name: 'notes', type: 'string', value: 'a@b.com' })).toBe(0.90);
+
+      protocol.semanticRules.email = field => email(field) * 0.9;
+      const result = protocol.analyze('user_email');
+      expect(result.semanticType).toBe('email');
+      expect(result.confidence).toBeCloseTo(0.855);
+    });
+
+    test('tables declared as subclass fields are compiled', () => {
+      class GeoProtocol extends SemanticProtocol {
+        semanticRules = { geo: field => (/lat|lng/.test(field.name) ? 0.99 : 0) };
+        renderMap = { 'geo:list': 'map:pin' };
+      }
+
+      const geo = new GeoProtocol();
+      expect(geo.analyze('lat').toString()).toBe('geo → map:pin (99%)');
+      expect(geo.getSupportedSemantics()).toEqual(['geo']);
+    });
+
+    test('registerRule() and registerRender() recompile', () => {
+      protocol
+        .registerRule('geo', field => (field.name === 'lat_lng' ? 0.99 : 0))
+        .registerRender('geo', 'list', 'map:pin');
+
+      expect(protocol.analyze('lat_lng').toString()).toBe('geo → map:pin (99%)');
+      expect(protocol.getSupportedSemantics()).toHaveLength(11);
+    });
+  });
+
+  describe('Value shapes', () => {
+    test('URL values are recognized by their prefix', () => {
+      for (const value of ['https://example.com', 'http://a', 'www.example.com']) {
+        expect(protocol.analyze('value', 'string', value).semanticType).toBe('url');
+      }
+      for (const value of ['ftp://example.com', 'wwx', 'h', '', 'see https://example.com']) {
+        expect(protocol.analyze('value', 'string', value).semanticType).toBe('default');
+      }
+    });
+  });
+
+  describe('Lean analysis', () => {
+    test('includeMatches = false picks the same winner', () => {
+      for (const { name, type, value } of fields) {
+        for (const context of contexts) {
+          const full = protocol.analyze(name, type, value, context);
+          const lean = protocol.analyze(name, type, value, context, false);
+          expect(lean.semanticType).toBe(full.semanticType);
+          expect(lean.renderInstruction).toBe(full.renderInstruction);
+          expect(lean.confidence).toBe(full.confidence);
+          expect(lean.metadata.allMatches).toBeUndefined();
+        }
+      }
+    });
+
+    test('includeMatches = false honours custom rules and first-rule ties', () => {
+      protocol.semanticRules.tie = field => (field.name === 'user_email' ? 0.95 : 0);
+      protocol.semanticRules.wide = field => (field.name === 'description' ? 0.5 : 0);
+      protocol.compile();
+
+      for (const { name, type, value } of fields) {
+        const full = protocol.analyze(name, type, value);
+        const lean = protocol.analyze(name, type, value, 'list', false);
+        expect(lean.semanticType).toBe(full.semanticType);
+        expect(lean.confidence).toBe(full.confidence);
+      }
+      expect(protocol.analyze('user_email', 'string', null, 'list', false).semanticType).toBe('email');
+      expect(protocol.analyze('description', 'string', null, 'list', false).semanticType).toBe('wide');
+    });
+  });
+});
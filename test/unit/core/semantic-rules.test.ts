@@ -0,0 +1,64 @@
+import { SemanticProtocol, SemanticRules, FieldDefinition } from '../../../semantic-protocol';
+import fixtures from '../../fixtures/fields.json';
+
+const fields = fixtures.fields as FieldDefinition[];
+const thresholds = [0, 50, 70, 90, 100];
+
+describe('TS SemanticRules', () => {
+  test('analyzeSchema() matches analyze() per field', () => {
+    const schema = [...fields, ...fields];
+    const results = SemanticRules.analyzeSchema(schema);
+
+    expect(results).toEqual(schema.map(field => SemanticRules.analyze(field)));
+    expect(new Set(results).size).toBe(schema.length);
+  });
+
+  test('best() is the first match of analyze()', () => {
+    for (const field of fields) {
+      const matches = SemanticRules.analyze(field);
+      expect(SemanticRules.best(field)).toEqual(matches.length > 0 ? matches[0] : null);
+    }
+  });
+
+  test('scoreMatrix() rows hold the analyze() confidences', () => {
+    const width = SemanticRules.SEMANTICS.length;
+    const matrix = SemanticRules.scoreMatrix(fields);
+    expect(matrix).toHaveLength(fields.length * width);
+
+    fields.forEach((field, row) => {
+      const expected = new Uint8Array(width);
+      for (const match of SemanticRules.analyze(field)) {
+        expected[SemanticRules.SEMANTICS.indexOf(match.semantic)] = match.confidence;
+      }
+      expect(matrix.subarray(row * width, (row + 1) * width)).toEqual(expected);
+    });
+  });
+});
+
+describe('TS SemanticProtocol', () => {
+  test('analyzeSchema() matches analyze() per field', () => {
+    const protocol = new SemanticProtocol();
+    for (const context of ['list', 'detail'] as const) {
+      expect(protocol.analyzeSchema(fields, context)).toEqual(fields.map(field => protocol.analyze(field, context)));
+    }
+  });
+
+  test('identify() picks the analyze() best match', () => {
+    for (const threshold of thresholds) {
+      const protocol = new SemanticProtocol(threshold);
+      for (const field of fields) {
+        const { bestMatch } = protocol.analyze(field);
+        expect(protocol.identify(field)).toBe(bestMatch ? bestMatch.semantic : null);
+      }
+    }
+  });
+
+  test('identifySchema() matches analyze() per field', () => {
+    for (const threshold of thresholds) {
+      const protocol = new SemanticProtocol(threshold);
+      expect(protocol.identifySchema(fields))
+        .toEqual(fields.map(field => protocol.analyze(field).bestMatch?.semantic ?? null));
+    }
+    expect(new SemanticProtocol().identifySchema([])).toEqual([]);
+  });
+});